@@ -22,6 +22,12 @@ from typing import Any, Dict, List, Optional, Set
 from pr_models import Team, RuleRequirement, merge_requirements
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 
 @dataclass(frozen=True)
 class GovernanceRule:
@@ -136,8 +142,8 @@ class GovernanceConfigParser:
             raise FileNotFoundError(f"Governance file not found at '{file_path}'.")
 
         try:
-            with open(file_path_obj, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # The raw bytes are handed straight to the loader, which detects the encoding itself
+            data = yaml.load(file_path_obj.read_bytes(), Loader=YamlSafeLoader)
         except Exception as e:
             raise ValueError(f"Failed to parse governance YAML: {e}")
 
@@ -207,7 +213,11 @@ class GovernanceConfigParser:
             patterns = [patterns]
 
         # Support both 'excluded_patterns' and 'excludes' (for backward compatibility)
-        excludes = rule_data.get("excluded_patterns", rule_data.get("excludes", []))
+        excludes = (
+            rule_data["excluded_patterns"]
+            if "excluded_patterns" in rule_data
+            else rule_data.get("excludes", [])
+        )
         if isinstance(excludes, str):
             excludes = [excludes]
 
@@ -349,7 +359,7 @@ class GovernanceConfigValidator:
             check=True,
         )
         return [
-            Path(line.strip()).as_posix()
+            Path(path).as_posix()
             for line in result.stdout.splitlines()
-            if line.strip()
+            if (path := line.strip())
         ]
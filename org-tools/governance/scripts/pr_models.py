@@ -17,6 +17,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from types import MappingProxyType
 
 
 class ReviewState(Enum):
@@ -30,9 +32,15 @@ class ReviewState(Enum):
     UNKNOWN = "unknown"
 
     @classmethod
-    def actionable_states(cls) -> set["ReviewState"]:
+    def actionable_states(cls) -> frozenset["ReviewState"]:
         """States that affect PR mergeability."""
-        return {cls.APPROVED, cls.CHANGES_REQUESTED, cls.DISMISSED}
+        return _ACTIONABLE_REVIEW_STATES
+
+
+# Built once so per-review membership checks do not allocate a new set
+_ACTIONABLE_REVIEW_STATES = frozenset(
+    {ReviewState.APPROVED, ReviewState.CHANGES_REQUESTED, ReviewState.DISMISSED}
+)
 
 
 class ValidationErrorReason(Enum):
@@ -76,11 +84,7 @@ class User:
     def create(cls, username: str, memberships: "TeamMemberships") -> "User":
         """Resolve a username into a rich User domain object."""
         username_lower = username.lower()
-        user_teams = {
-            team
-            for team, members in memberships.members_by_team.items()
-            if username_lower in members
-        }
+        user_teams = memberships.teams_by_member.get(username_lower, frozenset())
 
         # Calculate their max hierarchy level
         max_level = max((t.level for t in user_teams), default=0)
@@ -207,11 +211,15 @@ class PullRequest:
             assigned_team_names=assigned_t,
         )
 
-    @property
-    def latest_actionable_reviews_by_username(self) -> dict[str, ReviewState]:
+    @cached_property
+    def latest_actionable_reviews_by_username(
+        self,
+    ) -> MappingProxyType[str, ReviewState]:
         """Resolve the latest actionable review state for each user.
 
-        Skips non-actionable states like COMMENTED.
+        Skips non-actionable states like COMMENTED. Computed once per PR since
+        the validator consults it several times, so the shared result is a
+        read-only view and later changes to `reviews` are not reflected.
         """
         # Sort reviews by submitted_at (if available) to ensure chronological processing
         sorted_reviews = sorted(
@@ -225,7 +233,7 @@ class PullRequest:
         for r in sorted_reviews:
             if r.state in ReviewState.actionable_states():
                 relevant_reviews[r.user] = r.state
-        return relevant_reviews
+        return MappingProxyType(relevant_reviews)
 
     def has_proxy_override(self, proxy_reviewers: set[str]) -> bool:
         """Check if a proxy reviewer has approved the PR, bypassing rules."""
@@ -242,6 +250,23 @@ class TeamMemberships:
 
     members_by_team: dict[Team, set[str]]
 
+    # Reverse index of member usernames to their teams, derived from members_by_team
+    teams_by_member: dict[str, frozenset[Team]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Precompute the reverse index so user lookups do not scan every team
+        teams_by_member: dict[str, set[Team]] = {}
+        for team, members in self.members_by_team.items():
+            for member in members:
+                teams_by_member.setdefault(member, set()).add(team)
+        object.__setattr__(
+            self,
+            "teams_by_member",
+            {member: frozenset(teams) for member, teams in teams_by_member.items()},
+        )
+
     @classmethod
     def create(
         cls, members_by_team: dict[str, set[str]], teams: dict[str, Team]
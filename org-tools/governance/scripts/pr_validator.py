@@ -86,9 +86,20 @@ class GitHubClient:
         Maps them to the PullRequest dataclass.
         """
         try:
+            # The repository payload is unused; a lazy client goes straight to the PR
             repo = self.g.get_repo(repo_name)
             pr = repo.get_pull(pr_number)
 
+            # Draft PRs are rejected before files or reviews are evaluated, so skip fetching them
+            if pr.draft:
+                return PullRequest.create(
+                    number=pr.number,
+                    author=pr.user.login,
+                    is_draft=True,
+                    changed_files=[],
+                    reviews=[],
+                )
+
             # Fetch changed files
             changed_files = [f.filename for f in pr.get_files()]
 
@@ -259,14 +270,8 @@ class PullRequestValidator:
         self, requirements: list[RuleRequirement]
     ) -> set[str]:
         """Retrieve users who are authorized to satisfy any of the requirements."""
-        all_users = {
-            user
-            for members in self.memberships.members_by_team.values()
-            for user in members
-        }
-
         authorized = set()
-        for username in all_users:
+        for username in self.memberships.teams_by_member:
             user = User.create(username, self.memberships)
             for req in requirements:
                 if req.is_satisfied_by(user):
@@ -364,12 +369,17 @@ def run_validation(args: argparse.Namespace) -> ValidationResult:
 
     # 2. Authenticate and fetch data
     auth = Auth.Token(args.token)
-    g = Github(auth=auth)
+    # Lazy objects are only fetched when their attributes are read, so
+    # intermediate objects like the repository and organization cost no request
+    g = Github(auth=auth, lazy=True)
     github_client = GitHubClient(g)
 
-    # 3. Fetch team memberships & PR details
-    memberships = github_client.fetch_team_memberships(args.org, config)
+    # 3. Fetch PR details & team memberships (not needed to reject a draft PR)
     pr = github_client.fetch_pull_request(args.repo, args.pr)
+    if pr.is_draft:
+        memberships = TeamMemberships.create(members_by_team={}, teams=config.teams)
+    else:
+        memberships = github_client.fetch_team_memberships(args.org, config)
 
     # 4. Validate PR
     validator = PullRequestValidator(config, memberships)
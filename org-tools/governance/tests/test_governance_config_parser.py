@@ -108,6 +108,30 @@ class TestGovernanceConfigParser(unittest.TestCase):
                 parser.parse_file(str(temp_path))
             self.assertIn("Failed to parse governance YAML", str(ctx.exception))
 
+    def test_parse_legacy_excludes_key(self):
+        """Test that the legacy 'excludes' key is used when 'excluded_patterns' is absent."""
+        yaml_data = {
+            "team_hierarchy": {"devops": 1},
+            "rules": [
+                {
+                    "name": "Legacy Rule",
+                    "patterns": ["source/**"],
+                    "excludes": "source/special/**",
+                    "requires": [{"team": "devops", "min_approvals": 1}],
+                },
+                {
+                    "name": "Preferred Rule",
+                    "patterns": ["docs/**"],
+                    "excluded_patterns": ["docs/drafts/**"],
+                    "excludes": ["ignored/**"],
+                    "requires": [{"team": "devops", "min_approvals": 1}],
+                },
+            ],
+        }
+        config = GovernanceConfigParser()._parse(yaml_data)
+        self.assertEqual(config.rules[0].excluded_patterns, ["source/special/**"])
+        self.assertEqual(config.rules[1].excluded_patterns, ["docs/drafts/**"])
+
     def test_parse_invalid_root_type(self):
         """Test _parse raises ValueError when data is not a map."""
         parser = GovernanceConfigParser()
@@ -300,6 +324,26 @@ class TestGovernanceConfigValidator(unittest.TestCase):
         self.assertFalse(rule.matches("docs/file_10.md"))  # ? is only one character
         self.assertFalse(rule.matches("src/main.js"))  # wrong extension
 
+    def test_compile_pattern_translations(self):
+        """Tests that each glob wildcard compiles to its expected regex."""
+        cases = {
+            "**/": r"^(?:.*/)?$",
+            "docs/**": r"^docs/.*$",
+            "*.py": r"^[^/]*\.py$",
+            "file_?.md": r"^file_[^/]\.md$",
+            # '**/' is translated before '*', so the leftover '*' is a segment wildcard
+            "***/": r"^[^/]*(?:.*/)?$",
+        }
+        for pattern, expected in cases.items():
+            with self.subTest(pattern=pattern):
+                self.assertEqual(
+                    GovernanceRule._compile_pattern(pattern).pattern, expected
+                )
+
+        triple_star = GovernanceRule._compile_pattern("a/***/b")
+        self.assertTrue(triple_star.match("a/b"))
+        self.assertTrue(GovernanceRule._compile_pattern("***/").match("abc"))
+
     @patch("governance_config_parser.GovernanceConfigValidator._get_tracked_files")
     def test_validate_no_fallback_success(self, mock_get_files):
         """Test validate_no_fallback returns no errors when all files match a rule."""
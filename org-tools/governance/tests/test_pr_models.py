@@ -17,6 +17,7 @@
 import os
 import sys
 import unittest
+from datetime import datetime
 
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../scripts"))
@@ -87,6 +88,48 @@ class TestPRModels(unittest.TestCase):
             },
         )
 
+    def test_latest_actionable_reviews_computed_once(self):
+        """Test that the latest actionable reviews are resolved once and reused."""
+        pr = PullRequest.create(
+            number=1,
+            author="author",
+            is_draft=False,
+            changed_files=[],
+            reviews=[
+                Review.create(
+                    "alice", ReviewState.CHANGES_REQUESTED, datetime(2026, 1, 1)
+                ),
+                Review.create("alice", ReviewState.COMMENTED, datetime(2026, 1, 2)),
+                Review.create("alice", ReviewState.APPROVED, datetime(2026, 1, 3)),
+            ],
+        )
+        latest = pr.latest_actionable_reviews_by_username
+        self.assertEqual(latest, {"alice": ReviewState.APPROVED})
+        self.assertIs(pr.latest_actionable_reviews_by_username, latest)
+        # The shared result is read-only so callers cannot corrupt later reads
+        with self.assertRaises(TypeError):
+            latest["alice"] = ReviewState.CHANGES_REQUESTED
+
+    def test_team_memberships_reverse_index(self):
+        """Test that TeamMemberships precomputes the teams each member belongs to."""
+        tech_council = Team.create("tech-council", 3)
+        admins = Team.create("admins", 2)
+        memberships = TeamMemberships.create(
+            members_by_team={
+                "tech-council": {"Alice", "bob"},
+                "admins": {"BOB", "charlie"},
+            },
+            teams={"tech-council": tech_council, "admins": admins},
+        )
+        self.assertEqual(
+            memberships.teams_by_member,
+            {
+                "alice": frozenset({tech_council}),
+                "bob": frozenset({tech_council, admins}),
+                "charlie": frozenset({admins}),
+            },
+        )
+
     def test_user_create_factory(self):
         """Test that User.create resolves teams, level, and normalizes username."""
         teams = {
@@ -42,6 +42,7 @@ from pr_validator import (  # noqa: E402
     PullRequestValidator,
     GitHubClient,
     main,
+    run_validation,
 )
 from pr_models import (  # noqa: E402
     MergeableReason,
@@ -809,6 +810,102 @@ class TestFetchTeamMemberships(unittest.TestCase):
         self.assertIn("Could not fetch members for team 'devops'", str(ctx.exception))
 
 
+class TestFetchPullRequest(unittest.TestCase):
+    """Tests for GitHubClient.fetch_pull_request method."""
+
+    def test_fetch_success(self):
+        """Test fetch_pull_request maps the PR without fetching the repository payload."""
+        mock_github = MagicMock()
+        mock_repo = MagicMock()
+        mock_github.get_repo.return_value = mock_repo
+
+        mock_pr = MagicMock()
+        mock_pr.number = 7
+        mock_pr.user.login = "Author"
+        mock_pr.draft = False
+        mock_file = MagicMock()
+        mock_file.filename = "README.md"
+        mock_pr.get_files.return_value = [mock_file]
+        mock_review = MagicMock()
+        mock_review.user.login = "Reviewer"
+        mock_review.state = "APPROVED"
+        mock_review.submitted_at = None
+        mock_pr.get_reviews.return_value = [mock_review]
+        mock_pr.get_review_requests.return_value = ([], [])
+        mock_repo.get_pull.return_value = mock_pr
+
+        github_client = GitHubClient(mock_github)
+        pr = github_client.fetch_pull_request("my-org/my-repo", 7)
+
+        mock_github.get_repo.assert_called_once_with("my-org/my-repo")
+        mock_repo.get_pull.assert_called_once_with(7)
+        self.assertEqual(pr.author, "author")
+        self.assertEqual(pr.changed_files, ["README.md"])
+        self.assertEqual(
+            pr.reviews, [Review(user="reviewer", state=ReviewState.APPROVED)]
+        )
+
+    def test_fetch_draft_skips_files_and_reviews(self):
+        """Test fetch_pull_request does not fetch files, reviews or review requests for a draft PR."""
+        mock_github = MagicMock()
+        mock_pr = MagicMock()
+        mock_pr.number = 7
+        mock_pr.user.login = "author"
+        mock_pr.draft = True
+        mock_github.get_repo.return_value.get_pull.return_value = mock_pr
+
+        github_client = GitHubClient(mock_github)
+        pr = github_client.fetch_pull_request("my-org/my-repo", 7)
+
+        self.assertTrue(pr.is_draft)
+        self.assertEqual(pr.changed_files, [])
+        self.assertEqual(pr.reviews, [])
+        mock_pr.get_files.assert_not_called()
+        mock_pr.get_reviews.assert_not_called()
+        mock_pr.get_review_requests.assert_not_called()
+
+
+class TestRunValidation(unittest.TestCase):
+    """Tests for the run_validation flow."""
+
+    @patch("pr_validator.GitHubClient")
+    @patch("pr_validator.Github")
+    @patch("pr_validator.Auth.Token")
+    @patch("pr_validator.os.path.exists")
+    @patch("pr_validator.GovernanceConfigParser")
+    def test_draft_pr_skips_team_memberships(
+        self,
+        mock_parser_class,
+        mock_exists,
+        mock_token,
+        mock_github_class,
+        mock_github_client_class,
+    ):
+        """Test that team memberships are not fetched when the PR is a draft."""
+        mock_exists.return_value = True
+        mock_parser_class.return_value.parse_file.return_value = GovernanceConfig(
+            teams={"devops": Team("devops", 1)},
+            rules=[],
+            fallback=[],
+            proxy_reviewers=set(),
+        )
+        mock_gateway = mock_github_client_class.return_value
+        mock_gateway.fetch_pull_request.return_value = PullRequest.create(
+            number=1, author="author", is_draft=True, changed_files=[], reviews=[]
+        )
+
+        args = MagicMock()
+        args.rules_file = "rules.yml"
+        result = run_validation(args)
+
+        self.assertFalse(result.is_mergeable)
+        self.assertEqual(result.error, ValidationErrorReason.DRAFT_PR)
+        mock_gateway.fetch_team_memberships.assert_not_called()
+        mock_github_class.assert_called_once_with(
+            auth=mock_token.return_value, lazy=True
+        )
+
+
 class TestPRValidatorMain(unittest.TestCase):
     """Tests for the main function of pr_validator."""
 
@@ -41,6 +41,9 @@ from github import Auth, Github, GithubException
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger("sync_labels")
 
+# Hex color regex pattern, compiled once at import time
+HEX_COLOR_RE = re.compile(r"^[0-9a-fA-F]{6}$")
+
 
 def parse_yaml_labels(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -77,9 +80,9 @@ def parse_yaml_labels(file_path: str) -> List[Dict[str, Any]]:
         raw_aliases = item.get("aliases") or []
         aliases: List[str] = []
         if isinstance(raw_aliases, str):
-            aliases = [a.strip() for a in raw_aliases.split(",") if a.strip()]
+            aliases = [alias for a in raw_aliases.split(",") if (alias := a.strip())]
         elif isinstance(raw_aliases, list):
-            aliases = [str(a).strip() for a in raw_aliases if str(a).strip()]
+            aliases = [alias for a in raw_aliases if (alias := str(a).strip())]
 
         if name_str:
             labels.append(
@@ -106,9 +109,6 @@ def validate_and_check_conflicts(
     alias_to_name: Dict[str, str] = {}
     alias_to_file: Dict[str, str] = {}
 
-    # Hex color regex pattern
-    hex_color_pattern = re.compile(r"^[0-9a-fA-F]{6}$")
-
     # 1. Collect defined names for local file context validations if needed
     file_to_names: Dict[str, Set[str]] = {}
     if check_file_context:
@@ -138,7 +138,7 @@ def validate_and_check_conflicts(
             raise ValueError(
                 f"Schema Error: Label '{name}' defined in '{file_path}' is missing a hex color code."
             )
-        if not hex_color_pattern.match(color):
+        if not HEX_COLOR_RE.match(color):
             raise ValueError(
                 f"Schema Error: Label '{name}' defined in '{file_path}' has an invalid hex color '#{color}'. "
                 f"Color must be a valid 6-character hex code (e.g., 'd73a4a')."
@@ -239,7 +239,7 @@ def merge_labels(
         validate_and_check_conflicts(list_a, check_file_context=True)
         validate_and_check_conflicts(list_b, check_file_context=True)
     except Exception as e:
-        logger.error(f"Error parsing or verifying configuration files: {e}")
+        logger.error("Error parsing or verifying configuration files: %s", e)
         sys.exit(1)
     # 1. Validate the aggregated list of all loaded labels first
     all_labels = list_a + list_b
@@ -266,14 +266,16 @@ def verify_access(
     Verifies API access to the organization and target repositories before starting operations.
     Returns the list of resolved repository objects.
     """
-    logger.info(f"Verifying API access for organization '{org_name}'...")
+    logger.info("Verifying API access for organization '%s'...", org_name)
     auth = Auth.Token(token)
     g = Github(auth=auth)
     try:
         org = g.get_organization(org_name)
     except GithubException as e:
         logger.error(
-            f"Access Verification Failed: Cannot fetch organization '{org_name}': {e}"
+            "Access Verification Failed: Cannot fetch organization '%s': %s",
+            org_name,
+            e,
         )
         sys.exit(1)
 
@@ -287,7 +289,10 @@ def verify_access(
                 target_repos.append(repo)
             except GithubException as e:
                 logger.error(
-                    f"Access Verification Failed: Cannot access repository '{rname}' in org '{org_name}': {e}"
+                    "Access Verification Failed: Cannot access repository '%s' in org '%s': %s",
+                    rname,
+                    org_name,
+                    e,
                 )
                 sys.exit(1)
     else:
@@ -295,7 +300,9 @@ def verify_access(
             target_repos = list(org.get_repos())
         except GithubException as e:
             logger.error(
-                f"Access Verification Failed: Cannot list repositories under organization '{org_name}': {e}"
+                "Access Verification Failed: Cannot list repositories under organization '%s': %s",
+                org_name,
+                e,
             )
             sys.exit(1)
 
@@ -315,15 +322,15 @@ def sync_labels(
     dry_run: bool = True,
 ) -> None:
     logger.info(
-        f"\n=== Starting Label Sync for Org: {org_name} (Dry Run: {dry_run}) ==="
+        "\n=== Starting Label Sync for Org: %s (Dry Run: %s) ===", org_name, dry_run
     )
 
     for repo in target_repos:
-        logger.info(f"\nSyncing repository: {repo.name}...")
+        logger.info("\nSyncing repository: %s...", repo.name)
         try:
             existing = {label.name: label for label in repo.get_labels()}
         except GithubException as e:
-            logger.warning(f"  Skipping due to error fetching labels: {e}")
+            logger.warning("  Skipping due to error fetching labels: %s", e)
             continue
 
         # Keep track of labels we renamed or processed to avoid duplicate operations
@@ -340,7 +347,11 @@ def sync_labels(
             for alias in aliases:
                 if alias in existing and name not in existing:
                     logger.info(
-                        f"  [RENAME] Old label '{alias}' -> New label '{name}' (Color: #{color}, Desc: '{desc}')"
+                        "  [RENAME] Old label '%s' -> New label '%s' (Color: #%s, Desc: '%s')",
+                        alias,
+                        name,
+                        color,
+                        desc,
                     )
                     if not dry_run:
                         try:
@@ -351,7 +362,10 @@ def sync_labels(
                             del existing[alias]
                         except GithubException as e:
                             logger.error(
-                                f"    Failed to rename label '{alias}' to '{name}': {e}"
+                                "    Failed to rename label '%s' to '%s': %s",
+                                alias,
+                                name,
+                                e,
                             )
                     renamed = True
                     processed_labels.add(name)
@@ -363,29 +377,29 @@ def sync_labels(
             # 2. Standard Create/Update Logic
             if name not in existing:
                 logger.info(
-                    f"  [CREATE] Label '{name}' (Color: #{color}, Desc: '{desc}')"
+                    "  [CREATE] Label '%s' (Color: #%s, Desc: '%s')", name, color, desc
                 )
                 if not dry_run:
                     try:
                         repo.create_label(name=name, color=color, description=desc)
                     except GithubException as e:
-                        logger.error(f"    Failed to create label: {e}")
+                        logger.error("    Failed to create label: %s", e)
             else:
                 curr = existing[name]
                 curr_color = curr.color.lower()
                 curr_desc = curr.description or ""
 
                 if curr_color != color.lower() or curr_desc != desc:
-                    logger.info(f"  [UPDATE] Label '{name}':")
+                    logger.info("  [UPDATE] Label '%s':", name)
                     if curr_color != color.lower():
-                        logger.info(f"    Color: #{curr_color} -> #{color}")
+                        logger.info("    Color: #%s -> #%s", curr_color, color)
                     if curr_desc != desc:
-                        logger.info(f"    Desc: '{curr_desc}' -> '{desc}'")
+                        logger.info("    Desc: '%s' -> '%s'", curr_desc, desc)
                     if not dry_run:
                         try:
                             curr.edit(name=name, color=color, description=desc)
                         except GithubException as e:
-                            logger.error(f"    Failed to update label: {e}")
+                            logger.error("    Failed to update label: %s", e)
 
 
 def main() -> None:
@@ -458,20 +472,22 @@ differ from the YAML configurations. It will NEVER delete existing labels from y
         triage_labels = parse_yaml_labels(args.triage_config)
         validate_and_check_conflicts(triage_labels, check_file_context=True)
     except Exception as e:
-        logger.error(f"Error parsing or verifying configuration files: {e}")
+        logger.error("Error parsing or verifying configuration files: %s", e)
         sys.exit(1)
 
     try:
         target_labels = merge_labels(general_labels, triage_labels)
     except ValueError as e:
-        logger.error(f"Validation Error: {e}")
+        logger.error("Validation Error: %s", e)
         sys.exit(1)
 
     repos_list = (
-        [r.strip() for r in args.repos.split(",") if r.strip()] if args.repos else None
+        [name for r in args.repos.split(",") if (name := r.strip())]
+        if args.repos
+        else None
     )
     exclude_list = (
-        [r.strip() for r in args.exclude_repos.split(",") if r.strip()]
+        [name for r in args.exclude_repos.split(",") if (name := r.strip())]
         if args.exclude_repos
         else None
     )
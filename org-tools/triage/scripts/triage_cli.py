@@ -119,7 +119,7 @@ def triage_single_pr(
     try:
         repo_obj = client.get_repo(org_repo_name)
     except Exception as e:
-        raise RuntimeError(f"Failed to access repository {org_repo_name}: {e}")
+        raise RuntimeError(f"Failed to access repository {org_repo_name}: {e}") from e
 
     triage_job = TriageLabeler(client, repo_obj, dry_run=dry_run)
     triage_job.triage(pr_num)
@@ -181,7 +181,7 @@ def main(token: str, org: str, repos: str, pr: int, apply: bool) -> None:
 
     # Global safety net to catch any unexpected critical errors and exit cleanly.
     try:
-        repo_list = [r.strip() for r in repos.split(",") if r.strip()]
+        repo_list = [name for r in repos.split(",") if (name := r.strip())]
         if not repo_list:
             log_error("Error: No repositories specified in --repos.")
             sys.exit(1)
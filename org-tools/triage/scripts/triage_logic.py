@@ -35,6 +35,52 @@ UNDER_REVIEW_LABEL = "status:under-review"
 STALE_REVIEW_LABEL = "status:stale-review"
 BLOCKED_STALE_THRESHOLD_DAYS = 30
 STALE_REVIEW_THRESHOLD_DAYS = 21
+# Mutually exclusive status labels; at most one is kept on a PR
+STATUS_LABELS = frozenset(
+    {
+        NEEDS_TRIAGE_LABEL,
+        BLOCKED_LABEL,
+        STALE_LABEL,
+        UNDER_REVIEW_LABEL,
+        STALE_REVIEW_LABEL,
+    }
+)
+# Search API query shared by every bulk triage search
+SEARCH_QUERY_TEMPLATE = "is:pr is:open -is:draft {qualifier} repo:{repo}"
+# (log name, description, found-count log message, query qualifier) for each set of
+# PRs processed by bulk triage
+BULK_TRIAGE_SEARCHES = (
+    (
+        "Needs Triage",
+        "PRs needing triage",
+        "  Found %s PRs needing initial triage.",
+        "no:label",
+    ),
+    (
+        "Blocked",
+        "blocked PRs",
+        "  Found %s blocked PRs to check.",
+        f'label:"{BLOCKED_LABEL}"',
+    ),
+    (
+        "Under Review",
+        "PRs under review",
+        "  Found %s PRs under review to check.",
+        f'label:"{UNDER_REVIEW_LABEL}"',
+    ),
+    (
+        "Stale",
+        "stale PRs",
+        "  Found %s stale PRs to check.",
+        f'label:"{STALE_LABEL}"',
+    ),
+    (
+        "Stale Review",
+        "stale review PRs",
+        "  Found %s stale review PRs to check.",
+        f'label:"{STALE_REVIEW_LABEL}"',
+    ),
+)
 
 
 def log_error(message: str, *args) -> None:
@@ -79,6 +125,7 @@ class TriageLabeler:
         self._org = None
         self._is_org_checked = False
         self._member_cache = {}
+        self._label_applied_times_cache = None
 
     def triage_all_outstanding(self) -> None:
         """Triages the repository using the Search API.
@@ -91,78 +138,25 @@ class TriageLabeler:
         """
         logger.info("\nProcessing Repository: %s", self.repo.full_name)
 
-        query_needs_triage = (
-            f"is:pr is:open -is:draft no:label repo:{self.repo.full_name}"
-        )
-        query_blocked = f'is:pr is:open -is:draft label:"{BLOCKED_LABEL}" repo:{self.repo.full_name}'
-        query_under_review = f'is:pr is:open -is:draft label:"{UNDER_REVIEW_LABEL}" repo:{self.repo.full_name}'
-        query_stale = (
-            f'is:pr is:open -is:draft label:"{STALE_LABEL}" repo:{self.repo.full_name}'
-        )
-        query_stale_review = f'is:pr is:open -is:draft label:"{STALE_REVIEW_LABEL}" repo:{self.repo.full_name}'
-
-        logger.info("  Search Query (Needs Triage): %s", query_needs_triage)
-        logger.info("  Search Query (Blocked): %s", query_blocked)
-        logger.info("  Search Query (Under Review): %s", query_under_review)
-        logger.info("  Search Query (Stale): %s", query_stale)
-        logger.info("  Search Query (Stale Review): %s", query_stale_review)
-
-        pr_numbers = set()
-
-        try:
-            prs_needs_triage = self.client.search_issues(query_needs_triage)
-            logger.info(
-                "  Found %s PRs needing initial triage.", prs_needs_triage.totalCount
-            )
-            for pr in prs_needs_triage:
-                pr_numbers.add(pr.number)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to search PRs needing triage for {self.repo.full_name}: {e}"
-            )
-
-        try:
-            prs_blocked = self.client.search_issues(query_blocked)
-            logger.info("  Found %s blocked PRs to check.", prs_blocked.totalCount)
-            for pr in prs_blocked:
-                pr_numbers.add(pr.number)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to search blocked PRs for {self.repo.full_name}: {e}"
-            )
-
-        try:
-            prs_under_review = self.client.search_issues(query_under_review)
-            logger.info(
-                "  Found %s PRs under review to check.", prs_under_review.totalCount
-            )
-            for pr in prs_under_review:
-                pr_numbers.add(pr.number)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to search PRs under review for {self.repo.full_name}: {e}"
+        searches = [
+            (
+                name,
+                description,
+                found_message,
+                SEARCH_QUERY_TEMPLATE.format(
+                    qualifier=qualifier, repo=self.repo.full_name
+                ),
             )
+            for name, description, found_message, qualifier in BULK_TRIAGE_SEARCHES
+        ]
 
-        try:
-            prs_stale = self.client.search_issues(query_stale)
-            logger.info("  Found %s stale PRs to check.", prs_stale.totalCount)
-            for pr in prs_stale:
-                pr_numbers.add(pr.number)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to search stale PRs for {self.repo.full_name}: {e}"
-            )
+        for name, _, _, query in searches:
+            logger.info("  Search Query (%s): %s", name, query)
 
-        try:
-            prs_stale_review = self.client.search_issues(query_stale_review)
-            logger.info(
-                "  Found %s stale review PRs to check.", prs_stale_review.totalCount
-            )
-            for pr in prs_stale_review:
-                pr_numbers.add(pr.number)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to search stale review PRs for {self.repo.full_name}: {e}"
+        pr_numbers = set()
+        for _, description, found_message, query in searches:
+            pr_numbers.update(
+                self._search_pr_numbers(query, description, found_message)
             )
 
         logger.info("  Total unique PRs to process: %s", len(pr_numbers))
@@ -184,6 +178,28 @@ class TriageLabeler:
                     e,
                 )
 
+    def _search_pr_numbers(
+        self, query: str, description: str, found_message: str
+    ) -> set[int]:
+        """Returns the numbers of the PRs matching a search query.
+
+        Args:
+            query: The Search API query.
+            description: Names the searched PRs in error messages.
+            found_message: Log message format taking the number of PRs found.
+
+        Raises:
+            RuntimeError: If the Search API fails.
+        """
+        try:
+            results = self.client.search_issues(query)
+            logger.info(found_message, results.totalCount)
+            return {pr.number for pr in results}
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to search {description} for {self.repo.full_name}: {e}"
+            ) from e
+
     def triage(self, pr_num: int) -> None:
         """Runs the triage process for a single specific PR."""
         logger.info("\nProcessing Single PR #%s in %s", pr_num, self.repo.full_name)
@@ -193,14 +209,14 @@ class TriageLabeler:
             if e.status == 404:
                 raise RuntimeError(
                     f"PR #{pr_num} not found or access denied in {self.repo.full_name}"
-                )
+                ) from e
             raise RuntimeError(
                 f"Failed to fetch PR #{pr_num} in {self.repo.full_name}: {e}"
-            )
+            ) from e
         except Exception as e:
             raise RuntimeError(
                 f"Failed to fetch PR #{pr_num} in {self.repo.full_name}: {e}"
-            )
+            ) from e
 
         self._triage_pull(pull)
 
@@ -297,22 +313,7 @@ class TriageLabeler:
     ) -> datetime | None:
         """Returns the latest time a label was applied to a PR, or None."""
         try:
-            events = pull.get_issue_events()
-            latest_labeled_time = None
-            for event in events:
-                if (
-                    event.event == "labeled"
-                    and event.label
-                    and event.label.name == label_name
-                ):
-                    latest_labeled_time = event.created_at
-
-            if latest_labeled_time:
-                if latest_labeled_time.tzinfo is None:
-                    latest_labeled_time = latest_labeled_time.replace(
-                        tzinfo=timezone.utc
-                    )
-                return latest_labeled_time
+            return self._get_label_applied_times(pull).get(label_name)
         except Exception as e:
             log_error(
                 "Error getting label application time for PR #%s in %s: %s",
@@ -322,6 +323,35 @@ class TriageLabeler:
             )
         return None
 
+    def _get_label_applied_times(
+        self, pull: github.PullRequest.PullRequest
+    ) -> dict[str, datetime]:
+        """Returns the latest time each label was applied to a PR.
+
+        The issue events are downloaded once per PullRequest object and shared by
+        every label check on it. Only the most recent object is kept, so the times
+        are reused for as long as the same object is passed in; fetch a fresh
+        PullRequest to see events added since.
+        """
+        if self._label_applied_times_cache is not None:
+            cached_pull, cached_times = self._label_applied_times_cache
+            if cached_pull is pull:
+                return cached_times
+
+        applied_times = {}
+        for event in pull.get_issue_events():
+            if event.event == "labeled" and event.label:
+                labeled_time = event.created_at
+                # Skip malformed events rather than losing every label's time
+                if labeled_time is None:
+                    continue
+                if labeled_time.tzinfo is None:
+                    labeled_time = labeled_time.replace(tzinfo=timezone.utc)
+                applied_times[event.label.name] = labeled_time
+
+        self._label_applied_times_cache = (pull, applied_times)
+        return applied_times
+
     def _get_latest_activity_time_after(
         self, pull: github.PullRequest.PullRequest, threshold_time: datetime
     ) -> datetime | None:
@@ -659,14 +689,6 @@ class TriageLabeler:
         label_name: str,
     ) -> None:
         """Applies the given label to the PR and removes other mutually exclusive status labels."""
-        STATUS_LABELS = {
-            NEEDS_TRIAGE_LABEL,
-            BLOCKED_LABEL,
-            STALE_LABEL,
-            UNDER_REVIEW_LABEL,
-            STALE_REVIEW_LABEL,
-        }
-
         try:
             if not self.dry_run:
                 current_labels = {label.name for label in pull.labels}
@@ -363,6 +363,31 @@ class TestTriageLabelerBulkExecution(unittest.TestCase):
         self.assertIn('label:"status:stale-review"', query5)
         self.assertIn("repo:mock-org/mock-repo", query5)
 
+    def test_bulk_triage_logs_search_result_counts(self):
+        """Test that each search logs how many PRs it found."""
+        self.mock_client.search_issues.side_effect = [
+            MagicMock(totalCount=count) for count in (1, 2, 3, 4, 5)
+        ]
+
+        with self.assertLogs("triage", level="INFO") as logs:
+            self.labeler.triage_all_outstanding()
+
+        found_messages = [
+            record.getMessage()
+            for record in logs.records
+            if record.getMessage().startswith("  Found ")
+        ]
+        self.assertEqual(
+            found_messages,
+            [
+                "  Found 1 PRs needing initial triage.",
+                "  Found 2 blocked PRs to check.",
+                "  Found 3 PRs under review to check.",
+                "  Found 4 stale PRs to check.",
+                "  Found 5 stale review PRs to check.",
+            ],
+        )
+
     def test_bulk_triage_raises_runtime_error_on_search_failure(self):
         """Test that a failure during the Search API call raises a RuntimeError."""
         self.mock_client.search_issues.side_effect = Exception("Search failed")
@@ -374,6 +399,21 @@ class TestTriageLabelerBulkExecution(unittest.TestCase):
             str(ctx.exception),
         )
 
+    def test_bulk_triage_reports_which_search_failed(self):
+        """Test that a failure in a later search names that search in the RuntimeError."""
+        self.mock_client.search_issues.side_effect = [
+            MagicMock(totalCount=0),
+            Exception("Search failed"),
+        ]
+
+        with self.assertRaises(RuntimeError) as ctx:
+            self.labeler.triage_all_outstanding()
+        self.assertIn(
+            "Failed to search blocked PRs for mock-org/mock-repo",
+            str(ctx.exception),
+        )
+        self.mock_repo.get_pull.assert_not_called()
+
 
 class TestTriageLabelerSingleExecution(unittest.TestCase):
     """Tests for single PR triage execution and error handling."""
@@ -408,6 +448,9 @@ class TestTriageLabelerSingleExecution(unittest.TestCase):
             "PR #123 not found or access denied in mock-org/mock-repo",
             str(ctx.exception),
         )
+        # The original GithubException is preserved for callers that need its status/data
+        self.assertIs(ctx.exception.__cause__, self.mock_repo.get_pull.side_effect)
+        self.assertEqual(ctx.exception.__cause__.status, 404)
 
     def test_single_pr_triage_raises_runtime_error_on_unexpected_error(self):
         """Test that an unexpected exception when fetching a single PR raises a RuntimeError."""
@@ -579,6 +622,84 @@ class TestTriageLabelerBlockedStaleRules(unittest.TestCase):
         pr.labels = [mock_label]
         self.assertFalse(self.labeler._is_eligible_for_blocked_stale(pr))
 
+    def test_issue_events_are_fetched_once_per_pr(self):
+        """Issue events should be downloaded once and shared by every label check on a PR."""
+        pr = Mock(spec=github.PullRequest.PullRequest)
+        pr.number = 1
+        pr.state = "open"
+        pr.draft = False
+        pr.user.login = "author"
+
+        blocked_label = Mock()
+        blocked_label.name = "status:blocked"
+        stale_label = Mock()
+        stale_label.name = "status:stale"
+        pr.labels = [blocked_label, stale_label]
+
+        blocked_event = Mock()
+        blocked_event.event = "labeled"
+        blocked_event.label.name = "status:blocked"
+        blocked_event.created_at = datetime.now(timezone.utc) - timedelta(days=40)
+        stale_event = Mock()
+        stale_event.event = "labeled"
+        stale_event.label.name = "status:stale"
+        stale_event.created_at = datetime.now(timezone.utc) - timedelta(days=5)
+        pr.get_issue_events.return_value = [blocked_event, stale_event]
+
+        pr.get_issue_comments.return_value = []
+        pr.get_review_comments.return_value = []
+        pr.get_reviews.return_value = []
+        pr.get_commits.return_value = []
+
+        self.assertEqual(
+            self.labeler._get_label_applied_time(pr, "status:blocked"),
+            blocked_event.created_at,
+        )
+        self.assertEqual(
+            self.labeler._get_label_applied_time(pr, "status:stale"),
+            stale_event.created_at,
+        )
+        self.assertIsNone(
+            self.labeler._get_label_applied_time(pr, "status:under-review")
+        )
+        pr.get_issue_events.assert_called_once()
+
+        # Triaging the same PullRequest object reuses its events
+        self.labeler._triage_pull(pr)
+        pr.get_issue_events.assert_called_once()
+
+        # A freshly fetched PullRequest object re-downloads its events
+        fresh_pr = Mock(spec=github.PullRequest.PullRequest)
+        fresh_pr.number = 1
+        fresh_pr.get_issue_events.return_value = [stale_event]
+        self.assertIsNone(
+            self.labeler._get_label_applied_time(fresh_pr, "status:blocked")
+        )
+        fresh_pr.get_issue_events.assert_called_once()
+
+    def test_label_applied_time_skips_events_without_timestamp(self):
+        """An event without a timestamp should not hide the times of other labels."""
+        pr = Mock(spec=github.PullRequest.PullRequest)
+        pr.number = 1
+
+        malformed_event = Mock()
+        malformed_event.event = "labeled"
+        malformed_event.label.name = "status:stale"
+        malformed_event.created_at = None
+        blocked_event = Mock()
+        blocked_event.event = "labeled"
+        blocked_event.label.name = "status:blocked"
+        blocked_event.created_at = datetime.now(timezone.utc) - timedelta(days=40)
+        pr.get_issue_events.return_value = [blocked_event, malformed_event]
+
+        with patch("triage_logic.log_error") as mock_log_error:
+            self.assertEqual(
+                self.labeler._get_label_applied_time(pr, "status:blocked"),
+                blocked_event.created_at,
+            )
+            self.assertIsNone(self.labeler._get_label_applied_time(pr, "status:stale"))
+        mock_log_error.assert_not_called()
+
 
 class TestTriageLabelerStaleReviewRules(unittest.TestCase):
     """Tests for stale-review eligibility rules in TriageLabeler."""